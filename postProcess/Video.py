@@ -9,10 +9,11 @@ Post-processing pipeline for Basilisk bubble bursting simulations.
 
 Overview
 --------
-The helper executables `postProcess/getFacet` and `postProcess/getData` are
-compiled as part of the Basilisk workflow. This Python wrapper shells out to
-those binaries for every snapshot, reshapes the returned grids, and renders
-axisymmetric visualisations with strain-rate and velocity fields.
+The helper executable `postProcess/getData` is compiled as part of the
+Basilisk workflow. Each worker of this Python wrapper keeps one instance
+running, which restores every snapshot once and returns both the interface
+facets and the sampled grids; the wrapper then renders axisymmetric
+visualisations with strain-rate and velocity fields.
 
 Usage
 -----
@@ -21,42 +22,81 @@ Typical invocation from the repository root::
     python3 postProcess/Video.py --caseToProcess simulationCases/1000
 
 Command-line switches expose all relevant knobs (grid density, domain limits,
-time stride, CPU count). The output directory is created on-demand and filled
+time stride, CPU count). By default rendered frames are piped as raw RGB
+straight into a single ffmpeg process. With ``--keep-frames`` (or
+``--skip-video-encode``) the output directory is created on-demand and filled
 with zero-padded PNG files compatible with downstream stitching utilities.
 """
 
 import argparse
-import multiprocessing as mp
+import multiprocessing
 import os
 import shutil
 import subprocess as sp
+import tempfile
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
-from functools import partial
 from datetime import datetime
-from typing import Sequence, Tuple, Optional
+from itertools import islice
+from typing import FrozenSet, Iterable, Iterator, List, Sequence, Tuple, Optional
 
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
+
+# Frames are only ever rasterised to files or pipes, so figures are built
+# with the object-oriented API on an Agg canvas; pyplot (its figure manager
+# and global state) is never imported.
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.cm import ScalarMappable
 from matplotlib.collections import LineCollection
+from matplotlib.colors import Normalize, NoNorm
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from matplotlib.text import Text
 from matplotlib.ticker import StrMethodFormatter
 
-# Configure matplotlib with LaTeX if available, fallback otherwise
+# Mathtext renders every label we use; LaTeX is opt-in via --usetex because
+# it spawns an external latex process for each text element.
 matplotlib.rcParams["font.family"] = "serif"
-if shutil.which("latex"):
-    try:
-        matplotlib.rcParams["text.usetex"] = True
-        matplotlib.rcParams["text.latex.preamble"] = r"\usepackage{amsmath}"
-    except Exception:
-        matplotlib.rcParams["text.usetex"] = False
-else:
-    matplotlib.rcParams["text.usetex"] = False
+matplotlib.rcParams["text.usetex"] = False
 
 # Script directory for finding helper executables
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-HELPER_GETFACET = os.path.join(SCRIPT_DIR, "getFacet")
 HELPER_GETDATA = os.path.join(SCRIPT_DIR, "getData")
 
+# Helpers and ffmpeg move several MB per snapshot; use 1 MiB pipe buffers
+PIPE_BUFSIZE = 1 << 20
+
+# getData --binary record layout: z r D2 vel
+FIELD_COLUMNS = 4
+
+# getData --facets record layout: z1 r1 z2 r2
+FACET_COLUMNS = 4
+
+# Helpers emit single precision: colormaps and 8-bit frames resolve far
+# less than that, and imshow would downcast doubles to float32 anyway
+HELPER_DTYPE = np.dtype(np.float32)
+
+# Upper bound on snapshots per task when raw frames are streamed back
+MAX_STREAM_BATCH = 8
+
+# ffmpeg encoder settings. NVENC at its p5 preset with constant quality 23
+# roughly matches libx264's default CRF 23 while moving the encode onto the
+# GPU; `-b:v 0` lets the quality target alone drive the bitrate.
+X264_ARGS = ["-c:v", "libx264"]
+NVENC_ARGS = [
+    "-c:v", "h264_nvenc",
+    "-preset", "p5",
+    "-rc", "vbr",
+    "-cq", "23",
+    "-b:v", "0",
+]
+
+# Snapshots with fewer facets than this (the old ">100 output lines" cutoff)
+# are drawn without an interface.
+MIN_FACET_SEGMENTS = 34
+
 
 @dataclass(frozen=True)
 class DomainBounds:
@@ -92,8 +132,11 @@ class RuntimeConfig:
     case_dir: str
     output_dir: str
     skip_video_encode: bool
+    keep_frames: bool
+    usetex: bool
     framerate: int
     output_fps: int
+    video_codec: str
     # Colorbar bounds
     d2_vmin: float
     d2_vmax: float
@@ -108,6 +151,18 @@ class RuntimeConfig:
     def bounds(self) -> DomainBounds:
         return DomainBounds(self.rmin, self.rmax, self.zmin, self.zmax)
 
+    @property
+    def sample_shape(self) -> Tuple[int, int]:
+        """(nz, nr) of the getData sampling grid, derived exactly as getData does."""
+        nr = int(self.grids_per_r * self.rmax)
+        nz = int((self.zmax - self.zmin) / (self.rmax / nr))
+        return nz, nr
+
+    @property
+    def stream_frames(self) -> bool:
+        """Pipe frames straight into ffmpeg instead of writing PNG files."""
+        return not (self.keep_frames or self.skip_video_encode)
+
 
 @dataclass(frozen=True)
 class PlotStyle:
@@ -119,7 +174,11 @@ class PlotStyle:
     logic.
     """
 
+    # figure_size * dpi is the exact frame size; keep both sides even, as
+    # yuv420p encoding requires
     figure_size: Tuple[float, float] = (19.20, 10.80)
+    dpi: int = 100
+    axes_rect: Tuple[float, float, float, float] = (0.08, 0.08, 0.84, 0.84)
     tick_label_size: int = 20
     zero_axis_color: str = "grey"
     axis_color: str = "black"
@@ -129,6 +188,12 @@ class PlotStyle:
     left_colorbar_offset: float = 0.04
     right_colorbar_offset: float = 0.01
 
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        """(width, height) in pixels of every rendered frame."""
+        width, height = self.figure_size
+        return round(width * self.dpi), round(height * self.dpi)
+
 
 @dataclass(frozen=True)
 class SnapshotInfo:
@@ -148,7 +213,7 @@ class SnapshotInfo:
 @dataclass
 class FieldData:
     """
-    Structured holder around the grids returned by getData.
+    Structured holder around the float32 grids returned by getData.
 
     Includes strain-rate (D2) and velocity magnitude fields.
     """
@@ -170,6 +235,14 @@ class FieldData:
 
 PLOT_STYLE = PlotStyle()
 
+# Run-wide setup (config and style), set by main() before the pool starts so
+# forked workers inherit it instead of unpickling a copy.
+_RUN_SETUP: Optional[Tuple["RuntimeConfig", PlotStyle]] = None
+
+# Per-worker state installed once by _init_worker (see WorkerContext), so
+# each submitted task only carries its snapshot indices.
+_WORKER: Optional["WorkerContext"] = None
+
 
 def log_status(message: str, *, level: str = "INFO") -> None:
     """Print timestamped status messages for long-running CLI workflows."""
@@ -216,6 +289,15 @@ def parse_arguments() -> RuntimeConfig:
         "--skip-video-encode", action="store_true",
         help="Skip ffmpeg video encoding after frame generation"
     )
+    parser.add_argument(
+        "--keep-frames", action="store_true",
+        help="Write PNG frames to disk and encode from them instead of "
+             "piping frames straight into ffmpeg"
+    )
+    parser.add_argument(
+        "--usetex", action="store_true",
+        help="Typeset figure text with LaTeX (slow; default: mathtext)"
+    )
     parser.add_argument(
         "--framerate", type=int, default=90,
         help="Input framerate for ffmpeg (default: 90)"
@@ -224,6 +306,12 @@ def parse_arguments() -> RuntimeConfig:
         "--output-fps", type=int, default=30,
         help="Output video framerate (default: 30)"
     )
+    parser.add_argument(
+        "--video-codec", choices=["auto", "h264_nvenc", "libx264"],
+        default="auto",
+        help="H.264 encoder; auto uses NVENC when a usable NVIDIA GPU is "
+             "found, libx264 otherwise (default: auto)"
+    )
     # Colorbar bounds
     parser.add_argument(
         "--d2-vmin", type=float, default=-2.0,
@@ -242,6 +330,8 @@ def parse_arguments() -> RuntimeConfig:
         help="Max value for velocity colorbar (default: 1.0)"
     )
     args = parser.parse_args()
+    if args.d2_vmax <= args.d2_vmin or args.vel_vmax <= args.vel_vmin:
+        parser.error("colorbar bounds must satisfy vmax > vmin")
 
     # Default output directory
     output_dir = args.folderToSave if args.folderToSave else os.path.join(args.caseToProcess, "Video")
@@ -257,8 +347,11 @@ def parse_arguments() -> RuntimeConfig:
         case_dir=args.caseToProcess,
         output_dir=output_dir,
         skip_video_encode=args.skip_video_encode,
+        keep_frames=args.keep_frames,
+        usetex=args.usetex,
         framerate=args.framerate,
         output_fps=args.output_fps,
+        video_codec=args.video_codec,
         d2_vmin=args.d2_vmin,
         d2_vmax=args.d2_vmax,
         vel_vmin=args.vel_vmin,
@@ -266,118 +359,183 @@ def parse_arguments() -> RuntimeConfig:
     )
 
 
+def configure_text_rendering(usetex: bool) -> None:
+    """Switch figure text to LaTeX when requested and available."""
+    if not usetex:
+        matplotlib.rcParams["text.usetex"] = False
+        return
+    if not shutil.which("latex"):
+        log_status("latex not found on PATH; using mathtext", level="WARN")
+        matplotlib.rcParams["text.usetex"] = False
+        return
+    matplotlib.rcParams["text.usetex"] = True
+    matplotlib.rcParams["text.latex.preamble"] = r"\usepackage{amsmath}"
+
+
+def remove_if_exists(path: str) -> None:
+    """Delete a file, ignoring it if it was never created."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 def ensure_directory(path: str) -> None:
     """Create an output directory if it does not exist."""
     if not os.path.isdir(path):
         os.makedirs(path, exist_ok=True)
 
 
-def run_helper(command: Sequence[str], cwd: Optional[str] = None) -> Sequence[str]:
-    """
-    Run a helper executable and return its stderr as decoded lines.
+class SnapshotUnavailable(RuntimeError):
+    """A helper answered -1: the snapshot file could not be restored."""
 
-    The compiled helpers deliberately emit their payload to stderr, so stdout is
-    ignored and we return the informative stderr content.
+
+class HelperServer:
+    """
+    Long-lived helper executable running in server mode.
+
+    Passing ``-`` as the snapshot argument makes getData read snapshot paths
+    from stdin and answer each with length-prefixed blocks (an int64 count
+    followed by that many float32 values) on stdout, so one fork+exec serves
+    every snapshot a worker handles. Started with ``--facets``, each answer
+    holds the facet block and then the field block from a single restore.
+    Each worker owns its own server, so requests need no locking; the helper
+    exits by itself once its worker goes away and stdin hits EOF. stderr
+    only carries Basilisk diagnostics; it is spooled to a temporary file (an
+    unread pipe could fill up and stall the helper) and reported if the
+    helper fails.
 
     Note: Basilisk executables have issues with very long absolute paths,
-    so we support running from a specific working directory with relative paths.
+    so helpers run from the case directory and receive relative paths.
     """
-    process = sp.Popen(command, stdout=sp.PIPE, stderr=sp.PIPE, cwd=cwd)
-    _, stderr = process.communicate()
-    if process.returncode != 0:
-        raise RuntimeError(
-            f"Command {' '.join(command)} failed with code {process.returncode}:\n"
-            f"{stderr.decode('utf-8')}"
+
+    def __init__(self, command: Sequence[str], cwd: str):
+        self.command = list(command)
+        self.snapshot = ""  # request whose answer is being read
+        self._diagnostics = tempfile.TemporaryFile()
+        self._process = sp.Popen(
+            self.command,
+            stdin=sp.PIPE,
+            stdout=sp.PIPE,
+            stderr=self._diagnostics,
+            cwd=cwd,
+            bufsize=PIPE_BUFSIZE,
+        )
+
+    def request(self, snapshot: str) -> None:
+        """Ask for one snapshot; read its answer with ``read_block``."""
+        self.snapshot = snapshot
+        try:
+            self._process.stdin.write(snapshot.encode("utf-8") + b"\n")
+            self._process.stdin.flush()
+        except BrokenPipeError:
+            raise self._failure(f"exited before {snapshot}") from None
+
+    def read_block(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Read the next block of the current answer as float32 values.
+
+        When ``out`` is given, the payload is read straight into that
+        preallocated array, which it must fill exactly, and ``out`` is
+        returned. Raises SnapshotUnavailable if the snapshot cannot be
+        restored (the answer then holds no further blocks); the helper
+        stays usable for the next request.
+        """
+        count = int(np.frombuffer(self._read(8), dtype=np.int64)[0])
+        if count < 0:
+            raise SnapshotUnavailable(
+                f"{self.command[0]} could not restore {self.snapshot}"
+            )
+        if out is None:
+            return np.frombuffer(
+                self._read(HELPER_DTYPE.itemsize * count), dtype=HELPER_DTYPE
+            )
+        if count != out.size:
+            # keep the stream aligned on the next block
+            self._read(HELPER_DTYPE.itemsize * count)
+            raise RuntimeError(
+                f"{self.command[0]} returned {count} values for {self.snapshot}, "
+                f"expected {out.size} for an array of shape {out.shape}"
+            )
+        view = memoryview(out).cast("B")
+        filled = 0
+        while filled < len(view):
+            chunk = self._process.stdout.readinto(view[filled:])
+            if not chunk:
+                raise self._failure(f"stopped in the middle of {self.snapshot}")
+            filled += chunk
+        return out
+
+    def _read(self, size: int) -> bytes:
+        data = self._process.stdout.read(size)
+        if len(data) != size:
+            raise self._failure("stopped mid-response")
+        return data
+
+    def _failure(self, what: str) -> RuntimeError:
+        self._process.wait()
+        self._diagnostics.seek(0)
+        return RuntimeError(
+            f"Command {' '.join(self.command)} {what} "
+            f"(code {self._process.returncode}):\n"
+            f"{self._diagnostics.read().decode('utf-8', errors='replace')}"
         )
-    return stderr.decode("utf-8").split("\n")
 
 
-def get_facets(filename: str, case_dir: str):
-    """Collect interface facets from getFacet helper with axisymmetric mirroring.
+def get_facets(helper: HelperServer) -> np.ndarray:
+    """Collect interface facets from getData's answer with axisymmetric mirroring.
 
-    Shells out to the compiled ``getFacet`` executable, which extracts the
+    Reads the facet block of the current ``--facets`` answer: the
     volume-of-fluid (VOF) interface as a sequence of line segments. Since
     the simulation uses axisymmetric coordinates, only the r >= 0 half is
-    computed. This function mirrors each segment about r=0.
+    computed. This function mirrors all segments about r=0 in one array
+    operation.
 
     Args:
-        filename: Relative path to snapshot file (e.g., 'intermediate/snapshot-0.0100')
-        case_dir: Absolute path to case directory (used as cwd)
+        helper: getData server with a pending request
 
     Returns:
-        list[tuple]: Sequence of line segments, each as ((r1, z1), (r2, z2)).
-    """
-    temp2 = run_helper([HELPER_GETFACET, filename], cwd=case_dir)
-    segs = []
-    skip = False
-    if len(temp2) > 1e2:
-        for n1 in range(len(temp2)):
-            temp3 = temp2[n1].split(" ")
-            if temp3 == [""]:
-                skip = False
-                continue
-            if not skip and n1 + 1 < len(temp2):
-                temp4 = temp2[n1 + 1].split(" ")
-                r1, z1 = np.array([float(temp3[1]), float(temp3[0])])
-                r2, z2 = np.array([float(temp4[1]), float(temp4[0])])
-                segs.append(((r1, z1), (r2, z2)))
-                segs.append(((-r1, z1), (-r2, z2)))
-                skip = True
-    return segs
-
-
-def get_field(filename: str, case_dir: str, zmin: float, zmax: float, rmax: float, nr: int) -> FieldData:
-    """Read field arrays for a single snapshot from getData helper.
-
-    Shells out to the compiled ``getData`` executable, which samples the
-    strain-rate and velocity fields on a structured grid.
+        np.ndarray: (n_segments, 2, 2) array of segments ((r1, z1), (r2, z2)),
+        directly usable by ``LineCollection``.
+    """
+    # One float32 record per segment: z1 r1 z2 r2
+    block = helper.read_block()
+    if block.size % FACET_COLUMNS:
+        raise RuntimeError(
+            f"Truncated facet block for {helper.snapshot}: {block.size} "
+            f"values is not a multiple of {FACET_COLUMNS}"
+        )
+    records = block.reshape(-1, FACET_COLUMNS)
+    if len(records) < MIN_FACET_SEGMENTS:
+        return np.empty((0, 2, 2), dtype=HELPER_DTYPE)
+    segs = records[:, [1, 0, 3, 2]].reshape(-1, 2, 2)
+    mirrored = segs.copy()
+    mirrored[..., 0] *= -1
+    return np.concatenate([segs, mirrored])
 
-    Args:
-        filename: Relative path to snapshot file (e.g., 'intermediate/snapshot-0.0100')
-        case_dir: Absolute path to case directory (used as cwd)
-        zmin: Minimum axial coordinate for sampling domain
-        zmax: Maximum axial coordinate for sampling domain
-        rmax: Maximum radial coordinate (positive branch only)
-        nr: Number of grid points in radial direction
 
-    Returns:
-        FieldData: Structured container with reshaped 2D arrays.
-    """
-    temp2 = run_helper(
-        [
-            HELPER_GETDATA,
-            filename,
-            str(zmin),
-            str(0),
-            str(zmax),
-            str(rmax),
-            str(nr),
-        ],
-        cwd=case_dir,
-    )
-    Rtemp, Ztemp, D2temp, veltemp = [], [], [], []
+def get_field(helper: HelperServer, grid: np.ndarray) -> FieldData:
+    """Read field arrays for a single snapshot from getData's answer.
 
-    for n1 in range(len(temp2)):
-        temp3 = temp2[n1].split(" ")
-        if temp3 == [""]:
-            continue
-        Ztemp.append(float(temp3[0]))
-        Rtemp.append(float(temp3[1]))
-        D2temp.append(float(temp3[2]))
-        veltemp.append(float(temp3[3]))
+    Reads the field block of the current answer: the strain-rate and
+    velocity fields sampled on the structured grid the server was started
+    with. The output is read directly into ``grid``, a per-worker buffer
+    reused for every snapshot, so the returned fields are views that stay
+    valid until the next call.
 
-    R = np.asarray(Rtemp)
-    Z = np.asarray(Ztemp)
-    D2 = np.asarray(D2temp)
-    vel = np.asarray(veltemp)
-    nz = int(len(Z) / nr)
+    Args:
+        helper: getData server whose facet block, if any, was already read
+        grid: (nz, nr, FIELD_COLUMNS) float32 buffer, see ``sample_shape``
 
-    log_status(f"{os.path.basename(filename)}: nz = {nz}")
+    Returns:
+        FieldData: Structured container with 2D views into ``grid``.
+    """
+    nz = grid.shape[0]
+    # One float32 record per sample, z r D2 vel, z-major like getData's loops
+    helper.read_block(out=grid)
+    log_status(f"{os.path.basename(helper.snapshot)}: nz = {nz}")
 
-    R.resize((nz, nr))
-    Z.resize((nz, nr))
-    D2.resize((nz, nr))
-    vel.resize((nz, nr))
+    Z, R, D2, vel = (grid[..., k] for k in range(FIELD_COLUMNS))
 
     return FieldData(R=R, Z=Z, strain_rate=D2, velocity=vel, nz=nz)
 
@@ -390,6 +548,29 @@ def build_snapshot_info(index: int, config: RuntimeConfig) -> SnapshotInfo:
     return SnapshotInfo(index=index, time=time, source=source, target=target)
 
 
+def colormap_indices(
+    values: np.ndarray, vmin: float, vmax: float, levels: int
+) -> np.ndarray:
+    """
+    Quantize a field to colormap lookup-table indices.
+
+    Uses the same binning as ``Colormap.__call__`` on normalized data, so an
+    image drawn from these uint8 indices with ``NoNorm`` skips matplotlib's
+    per-frame normalization pass. Out-of-range values clip to the end
+    colors, as before.
+
+    Resampling then runs on the clipped indices rather than on the data.
+    That is exact when the image is downsampled (the default grid density),
+    but an upsampled image gets a halo at the edges of saturated regions
+    (e.g. velocity above vmax, or the D2 floor below vmin) that differs by
+    tens of levels from the float image. build_frame_template therefore only
+    enables quantization when each sample covers at most one pixel.
+    """
+    scaled = (values - np.float32(vmin)) * np.float32(levels / (vmax - vmin))
+    np.clip(scaled, 0, levels - 1, out=scaled)
+    return scaled.astype(np.uint8)
+
+
 def draw_domain_outline(ax, bounds: DomainBounds, style: PlotStyle) -> None:
     """Outline computational domain and symmetry line."""
     ax.plot(
@@ -437,7 +618,7 @@ def add_colorbar(fig, ax, mappable, *, align: str, label: str, style: PlotStyle)
     else:
         position = [l + w + style.right_colorbar_offset, b, style.colorbar_width, h]
     cb_ax = fig.add_axes(position)
-    colorbar = plt.colorbar(mappable, cax=cb_ax, orientation="vertical")
+    colorbar = fig.colorbar(mappable, cax=cb_ax, orientation="vertical")
     colorbar.set_label(label, fontsize=style.tick_label_size, labelpad=5)
     colorbar.ax.tick_params(labelsize=style.tick_label_size)
     colorbar.ax.yaxis.set_major_formatter(StrMethodFormatter("{x:,.2f}"))
@@ -447,51 +628,64 @@ def add_colorbar(fig, ax, mappable, *, align: str, label: str, style: PlotStyle)
     return colorbar
 
 
-def plot_snapshot(
-    field_data: FieldData,
-    facets,
-    bounds: DomainBounds,
-    snapshot: SnapshotInfo,
-    config: RuntimeConfig,
-    style: PlotStyle,
-) -> None:
+@dataclass
+class FrameTemplate:
+    """
+    Figure skeleton shared by every frame a worker renders.
+
+    Outline, axes limits, and colorbars never change between snapshots, so
+    they are built once; only the artists kept here are updated per frame.
     """
-    Render and persist a single snapshot figure.
+
+    fig: Figure
+    strain_rate: AxesImage
+    velocity: AxesImage
+    interface: LineCollection
+    title: Text
+    # Feed colormap_indices + NoNorm instead of float data + Normalize
+    quantized: bool
+
+
+def build_frame_template(
+    bounds: DomainBounds, config: RuntimeConfig, style: PlotStyle
+) -> FrameTemplate:
+    """
+    Construct the reusable figure with placeholder data.
 
     Visualization:
     - Left side: log10(D:D) strain-rate field
     - Right side: velocity magnitude
     """
-    fig, ax = plt.subplots()
-    fig.set_size_inches(*style.figure_size)
+    fig = Figure(figsize=style.figure_size, dpi=style.dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes(style.axes_rect)
 
     draw_domain_outline(ax, bounds, style)
     line_segments = LineCollection(
-        facets, linewidths=4, colors=style.interface_color, linestyle="solid"
+        [], linewidths=4, colors=style.interface_color, linestyle="solid"
     )
     ax.add_collection(line_segments)
 
-    rminp, rmaxp = field_data.radial_extent
-    zminp, zmaxp = field_data.axial_extent
+    placeholder = np.zeros((1, 1))
 
     # Left: Strain-rate field (D:D)
     cntrl1 = ax.imshow(
-        field_data.strain_rate,
+        placeholder,
         cmap="hot_r",
         interpolation="Bilinear",
         origin="lower",
-        extent=[-rminp, -rmaxp, zminp, zmaxp],
+        extent=[0, bounds.rmin, bounds.zmin, bounds.zmax],
         vmax=config.d2_vmax,
         vmin=config.d2_vmin,
     )
 
     # Right: Velocity magnitude
     cntrl2 = ax.imshow(
-        field_data.velocity,
+        placeholder,
         interpolation="Bilinear",
         cmap="Purples",
         origin="lower",
-        extent=[rminp, rmaxp, zminp, zmaxp],
+        extent=[0, bounds.rmax, bounds.zmin, bounds.zmax],
         vmax=config.vel_vmax,
         vmin=config.vel_vmin,
     )
@@ -499,13 +693,26 @@ def plot_snapshot(
     ax.set_aspect("equal")
     ax.set_xlim(bounds.rmin, bounds.rmax)
     ax.set_ylim(bounds.zmin, bounds.zmax)
-    ax.set_title(f"$t/\\tau_0$ = {snapshot.time:4.3f}", fontsize=style.tick_label_size)
+    title = ax.set_title("", fontsize=style.tick_label_size)
     ax.axis("off")
 
+    # When the field grid is at least as fine as the screen, images take uint8
+    # colormap indices and bypass normalization (see colormap_indices); when
+    # it is upsampled, they keep float data so interpolation stays exact.
+    # Either way the colorbars get their own mappables in physical units.
+    ax.apply_aspect()
+    quantized = config.sample_shape[0] >= ax.get_window_extent().height
+    if quantized:
+        cntrl1.set_norm(NoNorm())
+        cntrl2.set_norm(NoNorm())
+
     add_colorbar(
         fig,
         ax,
-        cntrl1,
+        ScalarMappable(
+            norm=Normalize(vmin=config.d2_vmin, vmax=config.d2_vmax),
+            cmap=cntrl1.get_cmap(),
+        ),
         align="left",
         label=r"$\log_{10}\left(\boldsymbol{\mathcal{D}:\mathcal{D}}\right)$",
         style=style,
@@ -513,52 +720,158 @@ def plot_snapshot(
     add_colorbar(
         fig,
         ax,
-        cntrl2,
+        ScalarMappable(
+            norm=Normalize(vmin=config.vel_vmin, vmax=config.vel_vmax),
+            cmap=cntrl2.get_cmap(),
+        ),
         align="right",
         label=r"$\|\boldsymbol{u}\|$",
         style=style,
     )
 
-    plt.savefig(snapshot.target, bbox_inches="tight")
-    plt.close(fig)
+    return FrameTemplate(
+        fig=fig,
+        strain_rate=cntrl1,
+        velocity=cntrl2,
+        interface=line_segments,
+        title=title,
+        quantized=quantized,
+    )
+
+
+def plot_snapshot(
+    template: FrameTemplate,
+    field_data: FieldData,
+    facets: np.ndarray,
+    snapshot: SnapshotInfo,
+    config: RuntimeConfig,
+) -> Optional[np.ndarray]:
+    """
+    Render a single snapshot into the worker's frame template.
+
+    Returns:
+        The rendered canvas as an (height, width, 3) uint8 RGB array when
+        frames are streamed to ffmpeg; otherwise the figure is saved to
+        ``snapshot.target`` and None is returned.
+    """
+    rminp, rmaxp = field_data.radial_extent
+    zminp, zmaxp = field_data.axial_extent
+
+    template.interface.set_segments(facets)
+    strain_rate, velocity = field_data.strain_rate, field_data.velocity
+    if template.quantized:
+        strain_rate = colormap_indices(
+            strain_rate,
+            config.d2_vmin,
+            config.d2_vmax,
+            template.strain_rate.get_cmap().N,
+        )
+        velocity = colormap_indices(
+            velocity,
+            config.vel_vmin,
+            config.vel_vmax,
+            template.velocity.get_cmap().N,
+        )
+    template.strain_rate.set_data(strain_rate)
+    template.strain_rate.set_extent([-rminp, -rmaxp, zminp, zmaxp])
+    template.velocity.set_data(velocity)
+    template.velocity.set_extent([rminp, rmaxp, zminp, zmaxp])
+    template.title.set_text(f"$t/\\tau_0$ = {snapshot.time:4.3f}")
+
+    fig = template.fig
+    if config.stream_frames:
+        fig.canvas.draw()
+        return np.ascontiguousarray(np.asarray(fig.canvas.buffer_rgba())[..., :3])
+    # Fixed canvas: no tight-bbox pass (which renders the figure twice), and
+    # saved frames match the streamed ones pixel for pixel.
+    fig.savefig(snapshot.target, dpi=fig.dpi)
+    return None
+
 
+@dataclass
+class WorkerContext:
+    """
+    Everything a worker process sets up once and reuses for each snapshot.
 
-def process_timestep(index: int, config: RuntimeConfig, style: PlotStyle) -> None:
+    Built by the pool initializer, so submitted tasks only carry indices.
+    """
+
+    config: RuntimeConfig
+    template: FrameTemplate
+    field_buffer: np.ndarray
+    helper: HelperServer
+
+
+def create_worker_context(config: RuntimeConfig, style: PlotStyle) -> WorkerContext:
+    """Build the figure, the field buffer, and start the helper server."""
+    configure_text_rendering(config.usetex)
+    nz, nr = config.sample_shape
+    # Helpers run from the case directory (they crash with very long
+    # absolute paths) and get snapshot paths relative to it
+    case_dir = os.path.abspath(config.case_dir)
+    helper = HelperServer(
+        [
+            HELPER_GETDATA,
+            "-",
+            str(config.zmin),
+            str(0),
+            str(config.zmax),
+            str(config.rmax),
+            str(nr),
+            "--facets",
+        ],
+        cwd=case_dir,
+    )
+    return WorkerContext(
+        config=config,
+        template=build_frame_template(config.bounds, config, style),
+        field_buffer=np.empty((nz, nr, FIELD_COLUMNS), dtype=HELPER_DTYPE),
+        helper=helper,
+    )
+
+
+def process_timestep(index: int, context: WorkerContext) -> Optional[np.ndarray]:
     """
     Worker executed for every timestep index.
 
-    Performs availability checks, loads helper outputs, and calls plot_snapshot.
+    Loads helper outputs and calls plot_snapshot; main() has already left
+    out snapshots that are missing or whose frame exists. Returns the RGB
+    frame when streaming to ffmpeg, None otherwise (including for a
+    snapshot that vanished since, which the helper reports).
     """
+    config = context.config
     snapshot = build_snapshot_info(index, config)
-    if not os.path.exists(snapshot.source):
-        log_status(f"Missing: {os.path.basename(snapshot.source)}", level="WARN")
-        return
-    if os.path.exists(snapshot.target):
-        log_status(f"Exists, skipping: {os.path.basename(snapshot.target)}")
-        return
 
     # Show relative path: CaseNo/intermediate/filename
     src_parts = snapshot.source.split(os.sep)
     src_rel = os.sep.join(src_parts[-3:]) if len(src_parts) >= 3 else snapshot.source
-    log_status(f"Processing {src_rel}")
 
     # Relative path for Basilisk helpers (they crash with very long absolute paths)
     rel_snapshot = os.path.join("intermediate", f"snapshot-{snapshot.time:.4f}")
-    case_dir = os.path.abspath(config.case_dir)
+
+    log_status(f"Processing {src_rel}")
 
     try:
-        facets = get_facets(rel_snapshot, case_dir)
-        nr = int(config.grids_per_r * config.rmax)
-        field_data = get_field(
-            rel_snapshot, case_dir, config.zmin, config.zmax, config.rmax, nr
+        context.helper.request(rel_snapshot)
+        facets = get_facets(context.helper)
+        field_data = get_field(context.helper, context.field_buffer)
+        frame = plot_snapshot(
+            context.template, field_data, facets, snapshot, config
         )
-        plot_snapshot(field_data, facets, config.bounds, snapshot, config, style)
+
+        if frame is not None:
+            log_status(f"Rendered: {src_rel}")
+            return frame
 
         # Show relative path: CaseNo/Video/filename
         tgt_parts = snapshot.target.split(os.sep)
         tgt_rel = os.sep.join(tgt_parts[-3:]) if len(tgt_parts) >= 3 else snapshot.target
         log_status(f"Saved: {tgt_rel}")
+        return None
 
+    except SnapshotUnavailable:
+        log_status(f"Missing: {os.path.basename(snapshot.source)}", level="WARN")
+        return None
     except Exception as err:
         log_status(
             f"Error at {src_rel} (t={snapshot.time:.4f}): {err}", level="ERROR"
@@ -566,34 +879,310 @@ def process_timestep(index: int, config: RuntimeConfig, style: PlotStyle) -> Non
         raise
 
 
-def encode_video(config: RuntimeConfig) -> None:
+def _init_worker(*setup) -> None:
+    """
+    Pool initializer: set up the per-worker context.
+
+    Forked workers are called without arguments and use the inherited
+    ``_RUN_SETUP``; other start methods pass it explicitly.
+    """
+    global _WORKER
+    _WORKER = create_worker_context(*(setup or _RUN_SETUP))
+
+
+def render_batch(indices: Sequence[int]) -> List[Tuple[int, Optional[np.ndarray]]]:
+    """Task submitted to the pool; pairs each result with its index."""
+    return [
+        (index, process_timestep(index, _WORKER)) for index in indices
+    ]
+
+
+def png_size(path: str) -> Optional[Tuple[int, int]]:
+    """(width, height) from a PNG's IHDR chunk, or None if it is not a PNG."""
+    with open(path, "rb") as handle:
+        header = handle.read(24)
+    if header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        return None
+    return int.from_bytes(header[16:20], "big"), int.from_bytes(header[20:24], "big")
+
+
+def pending_snapshots(
+    config: RuntimeConfig, existing_frames: FrozenSet[str], style: PlotStyle
+) -> List[int]:
+    """
+    Indices of the snapshots this run has to render, in snapshot order.
+
+    Filtering happens here, before the work is split, so a resumed run or a
+    simulation still in progress (missing snapshots at the end of the range)
+    spreads the remaining frames over all workers. The snapshot and output
+    directories are each listed once instead of stat'ing every file.
+
+    Existing frames are only reused if they have the current frame size;
+    frames from older layouts (tight bounding boxes, odd sizes) cannot be
+    encoded alongside new ones. The layout is a property of the whole
+    output directory, so only the first reusable frame is opened: if it is
+    stale, every existing frame is rendered again.
     """
-    Run ffmpeg to stitch PNG frames into an MP4 video.
+    intermediate = os.path.join(config.case_dir, "intermediate")
+    available = set(os.listdir(intermediate)) if os.path.isdir(intermediate) else set()
+    pending = []
+    reusable = []
+    for index in range(config.n_snapshots):
+        snapshot = build_snapshot_info(index, config)
+        if os.path.basename(snapshot.source) not in available:
+            log_status(f"Missing: {os.path.basename(snapshot.source)}", level="WARN")
+        elif os.path.basename(snapshot.target) in existing_frames:
+            reusable.append(index)
+        else:
+            pending.append(index)
+    if not reusable:
+        return pending
+
+    if png_size(build_snapshot_info(reusable[0], config).target) != style.frame_size:
+        log_status(
+            f"Re-rendering {len(reusable)} existing frames not sized "
+            f"{style.frame_size[0]}x{style.frame_size[1]}",
+            level="WARN",
+        )
+        return sorted(pending + reusable)
+    log_status(f"Exists, skipping: {len(reusable)} frames in {config.output_dir}")
+    return pending
+
+
+def dispatch_batches(
+    config: RuntimeConfig, indices: Sequence[int]
+) -> List[Sequence[int]]:
+    """
+    Split the pending indices into contiguous runs, one per submitted task.
+
+    PNG frames never leave the workers, so each worker gets a single
+    near-equal share of the pending snapshots and sees exactly one task. Streamed
+    batches carry raw frames (~6 MB each at 1920x1080) back to the parent,
+    so those stay small: about four per worker, at most MAX_STREAM_BATCH.
+    This caps the size of each result; run_timesteps separately caps how
+    many results exist at once.
+    """
+    total = len(indices)
+    if config.stream_frames:
+        size = min(max(1, total // (4 * config.cpus)), MAX_STREAM_BATCH)
+        count = -(-total // size)
+    else:
+        count = min(config.cpus, total)
+    return [indices[total * k // count:total * (k + 1) // count] for k in range(count)]
+
+
+def run_timesteps(
+    executor: Executor, batches: Sequence[Sequence[int]], max_in_flight: int
+) -> Iterator[Tuple[int, Optional[np.ndarray]]]:
+    """
+    Submit batches of snapshots and yield ``(index, frame)`` pairs in
+    snapshot order.
+
+    At most ``max_in_flight`` batches are submitted but not yet consumed; the
+    next one is only submitted after the oldest has been handed on. Batches
+    are contiguous and consumed in order, so frames come out in playback
+    order without a reorder buffer, and a slow first batch or a slow ffmpeg
+    stalls submission instead of letting rendered frames pile up in memory.
+    """
+    total = sum(len(indices) for indices in batches)
+    queued = iter(batches)
+    in_flight = deque(
+        executor.submit(render_batch, indices)
+        for indices in islice(queued, max_in_flight)
+    )
+    done = 0
+    while in_flight:
+        results = in_flight.popleft().result()
+        done += len(results)
+        yield from results
+        log_status(f"Progress: {done}/{total} snapshots")
+        # Only now is the consumer done with the previous frames
+        indices = next(queued, None)
+        if indices is not None:
+            in_flight.append(executor.submit(render_batch, indices))
+
+
+def video_output_path(config: RuntimeConfig) -> str:
+    """
+    Location of the encoded video.
 
     The output video is saved in the case directory with the case number
     as filename (e.g., simulationCases/1000/1000.mp4).
     """
-    # Extract case number from path
     case_no = os.path.basename(config.case_dir)
+    return os.path.join(config.case_dir, f"{case_no}.mp4")
+
+
+def nvenc_available() -> bool:
+    """
+    Whether ffmpeg can open an NVENC session on this host.
+
+    ``ffmpeg -encoders`` lists h264_nvenc whenever ffmpeg was built with it,
+    GPU or not, so this runs a fraction-of-a-second test encode instead.
+    """
+    probe = [
+        "ffmpeg", "-hide_banner",
+        "-loglevel", "error",
+        "-f", "lavfi",
+        "-i", "color=size=256x256:duration=0.1",
+        *NVENC_ARGS,
+        "-f", "null", "-",
+    ]
+    try:
+        result = sp.run(probe, stdout=sp.DEVNULL, stderr=sp.DEVNULL, timeout=60)
+    except (OSError, sp.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+def video_codec_args(config: RuntimeConfig) -> List[str]:
+    """Encoder arguments for ffmpeg, resolving ``--video-codec auto``."""
+    codec = config.video_codec
+    if codec == "auto":
+        codec = "h264_nvenc" if nvenc_available() else "libx264"
+    log_status(f"Video encoder: {codec}")
+    return NVENC_ARGS if codec == "h264_nvenc" else X264_ARGS
 
-    # Output path: <case_dir>/<case_no>.mp4
-    output_path = os.path.join(config.case_dir, f"{case_no}.mp4")
-    input_pattern = os.path.join(config.output_dir, "*.png")
 
+def start_video_stream(
+    config: RuntimeConfig, width: int, height: int, output_path: str, log_file
+) -> sp.Popen:
+    """Launch ffmpeg reading raw RGB frames of the given size from stdin."""
     cmd = [
         "ffmpeg", "-y",
+        "-loglevel", "error",
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-s", f"{width}x{height}",
         "-framerate", str(config.framerate),
-        "-pattern_type", "glob",
-        "-i", input_pattern,
-        "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
-        "-c:v", "libx264",
+        "-i", "-",
+        *video_codec_args(config),
+        "-r", str(config.output_fps),
+        "-pix_fmt", "yuv420p",
+        output_path
+    ]
+    # ffmpeg's stderr goes to a file: an unread pipe could fill and stall it
+    return sp.Popen(
+        cmd,
+        stdin=sp.PIPE,
+        stdout=sp.DEVNULL,
+        stderr=log_file,
+        bufsize=PIPE_BUFSIZE,
+    )
+
+
+def stream_video(config: RuntimeConfig, frames: Iterable[Optional[np.ndarray]]) -> None:
+    """
+    Pipe raw RGB frames into a single ffmpeg process.
+
+    Frames must arrive in playback order; None entries (missing or skipped
+    snapshots) are dropped. ffmpeg is started lazily on the first frame so
+    the raw video geometry can be taken from the rendered canvas, which
+    avoids PNG compression, disk writes, and PNG decoding altogether.
+
+    ffmpeg writes to a partial file next to the target, which replaces the
+    previous video only after a clean exit. If rendering fails or is
+    interrupted, ffmpeg is killed rather than sent EOF (which it would
+    treat as a normal end and finalize a truncated video).
+    """
+    output_path = video_output_path(config)
+    root, ext = os.path.splitext(output_path)
+    partial_path = f"{root}.partial{ext}"
+    process = None
+    with tempfile.TemporaryFile() as ffmpeg_log:
+        try:
+            for frame in frames:
+                if frame is None:
+                    continue
+                if process is None:
+                    shape = frame.shape
+                    log_status(f"Encoding video: {output_path}")
+                    process = start_video_stream(
+                        config, shape[1], shape[0], partial_path, ffmpeg_log
+                    )
+                if frame.shape != shape:
+                    raise RuntimeError(
+                        f"Frame size changed from {shape} to {frame.shape}"
+                    )
+                try:
+                    process.stdin.write(frame.data)
+                except BrokenPipeError:
+                    break  # ffmpeg died; its log is reported below
+        except BaseException:
+            if process is not None:
+                process.kill()
+                process.wait()
+                remove_if_exists(partial_path)
+            raise
+
+        if process is None:
+            log_status("No frames rendered; skipping video encoding", level="WARN")
+            return
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.wait()
+        if process.returncode != 0:
+            remove_if_exists(partial_path)
+            ffmpeg_log.seek(0)
+            stderr = ffmpeg_log.read().decode("utf-8", errors="replace")
+            log_status(f"ffmpeg error: {stderr}", level="ERROR")
+            raise RuntimeError(f"ffmpeg failed with code {process.returncode}")
+    os.replace(partial_path, output_path)
+    log_status(f"Video saved: {output_path}")
+
+
+def encode_video(config: RuntimeConfig) -> None:
+    """
+    Run ffmpeg to stitch PNG frames on disk into an MP4 video.
+
+    Used when frames are kept (``--keep-frames``); see ``video_output_path``
+    for the output location. Frames are fed through an ffconcat list built
+    from the deterministic per-snapshot filenames, so ffmpeg reads them in
+    exact snapshot order without globbing and sorting the directory.
+    """
+    output_path = video_output_path(config)
+    existing = set(os.listdir(config.output_dir))
+    frames = [
+        name
+        for name in (
+            os.path.basename(build_snapshot_info(i, config).target)
+            for i in range(config.n_snapshots)
+        )
+        if name in existing
+    ]
+    if not frames:
+        log_status("No frames found; skipping video encoding", level="WARN")
+        return
+
+    # Entries are relative to the list file, which lives next to the frames.
+    # The last frame is repeated because ffmpeg ignores the final duration.
+    duration = 1.0 / config.framerate
+    lines = ["ffconcat version 1.0"]
+    for name in frames:
+        lines += [f"file '{name}'", f"duration {duration:.6f}"]
+    lines.append(f"file '{frames[-1]}'")
+    list_path = os.path.join(config.output_dir, "frames.ffconcat")
+    with open(list_path, "w") as handle:
+        handle.write("\n".join(lines) + "\n")
+
+    cmd = [
+        "ffmpeg", "-y",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", list_path,
+        *video_codec_args(config),
         "-r", str(config.output_fps),
         "-pix_fmt", "yuv420p",
         output_path
     ]
 
     log_status(f"Encoding video: {output_path}")
-    result = sp.run(cmd, capture_output=True, text=True)
+    try:
+        result = sp.run(cmd, capture_output=True, text=True)
+    finally:
+        os.remove(list_path)
     if result.returncode != 0:
         log_status(f"ffmpeg error: {result.stderr}", level="ERROR")
         raise RuntimeError(f"ffmpeg failed with code {result.returncode}")
@@ -603,17 +1192,45 @@ def encode_video(config: RuntimeConfig) -> None:
 def main():
     """Entry point for CLI invocation."""
     config = parse_arguments()
-    ensure_directory(config.output_dir)
+    existing_frames: FrozenSet[str] = frozenset()
+    if not config.stream_frames:
+        ensure_directory(config.output_dir)
+        existing_frames = frozenset(os.listdir(config.output_dir))
 
     log_status(f"Processing case: {config.case_dir}")
     log_status(f"Domain: R=[{config.rmin:.2f},{config.rmax:.2f}], Z=[{config.zmin:.2f},{config.zmax:.2f}]")
 
-    with mp.Pool(processes=config.cpus) as pool:
-        worker = partial(process_timestep, config=config, style=PLOT_STYLE)
-        pool.map(worker, range(config.n_snapshots))
-
-    # Encode video unless skipped
-    if not config.skip_video_encode:
+    pending = pending_snapshots(config, existing_frames, PLOT_STYLE)
+
+    global _RUN_SETUP
+    _RUN_SETUP = (config, PLOT_STYLE)
+    context = multiprocessing.get_context()
+    inherited = context.get_start_method() == "fork"
+
+    with ProcessPoolExecutor(
+        max_workers=config.cpus,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=() if inherited else _RUN_SETUP,
+    ) as executor:
+        try:
+            # About two batches per worker keeps every worker busy while
+            # bounding how many rendered frames the parent holds
+            results = run_timesteps(
+                executor, dispatch_batches(config, pending), 2 * config.cpus
+            )
+            if config.stream_frames:
+                stream_video(config, (frame for _, frame in results))
+            else:
+                for _ in results:
+                    pass
+        except BaseException:
+            # Do not keep rendering the backlog after a failure or Ctrl-C
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+    # Encode video from PNG frames unless skipped
+    if not config.stream_frames and not config.skip_video_encode:
         encode_video(config)
 
 
@@ -8,6 +8,7 @@
 
 #include "utils.h"
 #include "output.h"
+#include "fractions.h"
 
 /**
  * Geometry configuration: Set AXI=1 for axisymmetric, AXI=0 for 2D Cartesian.
@@ -32,7 +33,18 @@ vector u[];
  *   2. Restore the snapshot (`restore(file=...)`).
  *   3. Register each derived scalar in `field_list`.
  *   4. Compute fields and interpolate them onto a regular grid.
- *   5. Stream x, y, <fields...> rows to stderr (used as output pipe).
+ *   5. Stream x, y, <fields...> rows to stderr (used as output pipe), or
+ *      with a trailing `--binary` flag, as raw native-endian floats on
+ *      stdout (one record of 2 + n_fields values per sample, same order).
+ *      Single precision is plenty for plotting and halves the stream.
+ *
+ * Server mode: pass `-` as the filename to keep one process alive for many
+ * snapshots. Paths are read from stdin, one per line; each is answered on
+ * stdout with an int64 count of floats (-1 if the snapshot cannot be
+ * restored) followed by that many floats in the `--binary` layout.
+ * With a trailing `--facets`, each answer starts with a second block of the
+ * same form holding the interface facets, one `x1 y1 x2 y2` float record
+ * per segment, so one restore serves both the fields and the interface.
  *
  * To add a new derived quantity (e.g., Aij):
  *   1. Declare scalar: `scalar Aij[];` (line ~38)
@@ -45,6 +57,8 @@ typedef struct {
   double xmin, ymin, xmax, ymax;
   double Deltax, Deltay;
   int nx, ny;
+  int binary;
+  int facets;
 } extraction_config;
 
 scalar D2c[], vel[];
@@ -61,6 +75,13 @@ static void sample_fields(const extraction_config *cfg, double **field_buffer,
                           int field_count);
 static void write_fields(const extraction_config *cfg, double **field_buffer,
                          int field_count, FILE *fp);
+static void write_fields_binary(const extraction_config *cfg,
+                                double **field_buffer, int field_count,
+                                FILE *fp);
+static void serve_snapshots(const extraction_config *cfg,
+                            double **field_buffer, int field_count,
+                            FILE *fp);
+static Array * collect_facets(scalar c);
 static void cleanup_output(FILE *fp, double **field_buffer);
 static void compute_D2c_field(scalar target);
 static void compute_velocity_field(scalar target);
@@ -70,9 +91,11 @@ static void compute_velocity_field(scalar target);
    *
    * This function validates command-line arguments and orchestrates the simulation
    * data restoration, derivative and velocity computations, and interpolation onto
-   * a grid. It expects the program name followed by exactly six parameters:
+   * a grid. It expects the program name followed by six parameters:
    * a filename, the lower bounds (xmin and ymin), the upper bounds (xmax and ymax), and
-   * the number of divisions along the y-axis (ny). If the argument count is incorrect,
+   * the number of divisions along the y-axis (ny), optionally followed by
+   * `--binary` to select the binary stdout format and, in server mode,
+   * `--facets` to prepend the interface facets. If the argument count is incorrect,
    * an error message and usage instructions are printed to stderr and the program exits
    * with a status of 1.
    *
@@ -92,28 +115,53 @@ static void compute_velocity_field(scalar target);
     return 1;
 
   register_fields();
-  restore (file = cfg.filename);
-  compute_fields();
-
   int registered_fields = list_len(field_list);
   double ** field =
     allocate_field_buffer(&cfg, registered_fields);
+
+  if (!strcmp(cfg.filename, "-")) {
+    FILE * fp = fout;
+    serve_snapshots(&cfg, field, registered_fields, fp);
+    cleanup_output(fp, field);
+    return 0;
+  }
+
+  restore (file = cfg.filename);
+  compute_fields();
   sample_fields(&cfg, field, registered_fields);
 
-  FILE * fp = ferr;
-  write_fields(&cfg, field, registered_fields, fp);
-  cleanup_output(fp, field);
+  if (cfg.binary) {
+    FILE * fp = fout;
+    write_fields_binary(&cfg, field, registered_fields, fp);
+    cleanup_output(fp, field);
+  }
+  else {
+    FILE * fp = ferr;
+    write_fields(&cfg, field, registered_fields, fp);
+    cleanup_output(fp, field);
+  }
 }
 
 static int parse_arguments(int argc, char const *argv[],
                            extraction_config *cfg)
 {
   /** Read CLI arguments and guard against invalid bounds/grid sizes. */
-  if (argc != 7) {
+  int valid = (argc >= 7);
+  cfg->binary = 0;
+  cfg->facets = 0;
+  for (int i = 7; i < argc; i++) {
+    if (!strcmp(argv[i], "--binary"))
+      cfg->binary = 1;
+    else if (!strcmp(argv[i], "--facets"))
+      cfg->facets = 1;
+    else
+      valid = 0;
+  }
+  if (!valid) {
     fprintf(stderr, "Error: Expected 6 arguments\n");
     fprintf(stderr,
             "Usage: %s <filename> <xmin> <ymin> "
-            "<xmax> <ymax> <ny>\n", argv[0]);
+            "<xmax> <ymax> <ny> [--binary] [--facets]\n", argv[0]);
     return 0;
   }
 
@@ -219,6 +267,86 @@ static void write_fields(const extraction_config *cfg, double **field_buffer,
   }
 }
 
+static void write_fields_binary(const extraction_config *cfg,
+                                double **field_buffer, int registered_fields,
+                                FILE *fp)
+{
+  /**
+   * Same rows as write_fields, but as raw floats so the reader can map
+   * the stream straight onto an array instead of parsing text.
+   */
+  int record_length = 2 + registered_fields;
+  float * record = (float *) malloc (record_length*sizeof(float));
+  for (int i = 0; i < cfg->nx; i++) {
+    record[0] = cfg->Deltax*(i + 1./2) + cfg->xmin;
+    for (int j = 0; j < cfg->ny; j++) {
+      record[1] = cfg->Deltay*(j + 1./2) + cfg->ymin;
+      for (int k = 0; k < registered_fields; k++)
+        record[2 + k] = field_buffer[i][registered_fields*j + k];
+      fwrite (record, sizeof(float), record_length, fp);
+    }
+  }
+  free (record);
+}
+
+static void serve_snapshots(const extraction_config *cfg,
+                            double **field_buffer, int registered_fields,
+                            FILE *fp)
+{
+  /**
+   * Answer one length-prefixed block per snapshot path read from stdin
+   * (two with `--facets`: facets, then fields), reusing the grid
+   * configuration and sampling buffer across snapshots.
+   */
+  char path[4096];
+  while (fgets(path, sizeof(path), stdin)) {
+    path[strcspn(path, "\r\n")] = '\0';
+    if (!path[0])
+      continue;
+    int64_t count = -1;
+    if (restore (file = path)) {
+      if (cfg->facets) {
+        Array * records = collect_facets(f);
+        int64_t facet_count = records->len/sizeof(float);
+        fwrite (&facet_count, sizeof(facet_count), 1, fp);
+        fwrite (records->p, 1, records->len, fp);
+        array_free (records);
+      }
+      compute_fields();
+      sample_fields(cfg, field_buffer, registered_fields);
+      count = (int64_t) cfg->nx*cfg->ny*(2 + registered_fields);
+      fwrite (&count, sizeof(count), 1, fp);
+      write_fields_binary(cfg, field_buffer, registered_fields, fp);
+    }
+    else
+      fwrite (&count, sizeof(count), 1, fp);
+    fflush (fp);
+  }
+}
+
+static Array * collect_facets(scalar c)
+{
+  /**
+   * Same facets as `output_facets()`, as fixed-size float records, collected
+   * first so the block can be prefixed with its count.
+   */
+  Array * records = array_new();
+  foreach (serial)
+    if (c[] > 1e-6 && c[] < 1. - 1e-6) {
+      coord n = interface_normal(point, c);
+      double alpha = plane_alpha(c[], n);
+      coord segment[2];
+      if (facets(n, alpha, segment) == 2) {
+        float record[4] = {
+          x + segment[0].x*Delta, y + segment[0].y*Delta,
+          x + segment[1].x*Delta, y + segment[1].y*Delta
+        };
+        array_append(records, record, sizeof(record));
+      }
+    }
+  return records;
+}
+
 static void cleanup_output(FILE *fp, double **field_buffer)
 {
   fflush (fp);
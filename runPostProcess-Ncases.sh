@@ -23,8 +23,7 @@ fi
 # Post-processing script paths
 VIDEO_SCRIPT="${SCRIPT_DIR}/postProcess/Video.py"
 
-# C helper executables
-HELPER_GETFACET="${SCRIPT_DIR}/postProcess/getFacet"
+# C helper executable (serves both facets and fields to Video.py)
 HELPER_GETDATA="${SCRIPT_DIR}/postProcess/getData"
 
 # Case directory root
@@ -57,6 +56,11 @@ Options:
     --vel-vmax F        Max value for velocity colorbar (default: 1.0)
 
     --skip-video-encode Skip ffmpeg video encoding after frame generation
+    --keep-frames       Write PNG frames to Video/ and encode from them
+                        (default: pipe frames straight into ffmpeg)
+    --usetex            Typeset figure text with LaTeX (slow; default: mathtext)
+    --video-codec C     H.264 encoder: auto, h264_nvenc or libx264
+                        (default: auto, NVENC if a usable GPU is found)
 
     -n, --dry-run       Show what would run without executing
     -v, --verbose       Verbose output
@@ -78,11 +82,18 @@ Examples:
     # Skip video encoding (only generate frames)
     $0 --skip-video-encode 1000 1001
 
+    # Keep PNG frames alongside the video
+    $0 --keep-frames 1000
+
+    # Encode on the CPU even if an NVIDIA GPU is available
+    $0 --video-codec libx264 1000
+
     # Dry run to preview commands
     $0 --dry-run 1000
 
 Output locations:
-    simulationCases/<CaseNo>/Video/        # PNG frames
+    simulationCases/<CaseNo>/Video/        # PNG frames (--keep-frames or
+                                           #   --skip-video-encode only)
     simulationCases/<CaseNo>/<CaseNo>.mp4  # Encoded video
 
 For more information, see CLAUDE.md
@@ -105,6 +116,9 @@ VEL_VMIN="0.0"
 VEL_VMAX="1.0"
 
 SKIP_VIDEO_ENCODE=0
+KEEP_FRAMES=0
+USETEX=0
+VIDEO_CODEC="auto"
 DRY_RUN=0
 VERBOSE=0
 
@@ -172,6 +186,22 @@ while [[ $# -gt 0 ]]; do
             SKIP_VIDEO_ENCODE=1
             shift
             ;;
+        --keep-frames)
+            KEEP_FRAMES=1
+            shift
+            ;;
+        --usetex)
+            USETEX=1
+            shift
+            ;;
+        --video-codec)
+            VIDEO_CODEC="$2"
+            if ! [[ "$VIDEO_CODEC" =~ ^(auto|h264_nvenc|libx264)$ ]]; then
+                echo "ERROR: --video-codec must be auto, h264_nvenc or libx264, got: $VIDEO_CODEC" >&2
+                exit 1
+            fi
+            shift 2
+            ;;
         -n|--dry-run)
             DRY_RUN=1
             shift
@@ -232,8 +262,8 @@ if [ ! -f "$VIDEO_SCRIPT" ]; then
     exit 1
 fi
 
-# Check C helpers exist
-for helper in "$HELPER_GETFACET" "$HELPER_GETDATA"; do
+# Check C helper exists
+for helper in "$HELPER_GETDATA"; do
     if [ ! -x "$helper" ]; then
         helper_name=$(basename "$helper")
         echo "ERROR: Compiled helper not found or not executable: $helper" >&2
@@ -258,6 +288,7 @@ echo "  tsnap:      $TSNAP"
 echo "  GridsPerR:  $GRIDS_PER_R"
 echo "  Domain:     Z=[$ZMIN, $ZMAX], R=[0, $RMAX]"
 echo "  Colorbars:  D2=[$D2_VMIN, $D2_VMAX], vel=[$VEL_VMIN, $VEL_VMAX]"
+echo "  Encoder:    $VIDEO_CODEC"
 echo ""
 echo "Pipeline:"
 [ $SKIP_VIDEO_ENCODE -eq 0 ] && echo "  [1] Video.py (frames + video)" || echo "  [1] Video.py (frames only, video SKIPPED)"
@@ -289,10 +320,13 @@ run_video() {
         "--d2-vmax" "${D2_VMAX}"
         "--vel-vmin" "${VEL_VMIN}"
         "--vel-vmax" "${VEL_VMAX}"
+        "--video-codec" "${VIDEO_CODEC}"
     )
 
     # Add skip flag if needed
     [ $SKIP_VIDEO_ENCODE -eq 1 ] && cmd_args+=("--skip-video-encode")
+    [ $KEEP_FRAMES -eq 1 ] && cmd_args+=("--keep-frames")
+    [ $USETEX -eq 1 ] && cmd_args+=("--usetex")
 
     if [ $VERBOSE -eq 1 ] || [ $DRY_RUN -eq 1 ]; then
         echo "  CMD: python ${VIDEO_SCRIPT} ${cmd_args[*]}"